@@ -0,0 +1,320 @@
+import asyncio
+import copy
+import dataclasses
+import ipaddress
+import json
+import pickle
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+import ztp_implementation_2_10_2025 as ztp
+from ztp_implementation_2_10_2025 import DHCPConfig, NetworkConfig, VLANConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    ztp._RESPONSE_CACHE.clear()
+    yield
+    ztp._RESPONSE_CACHE.clear()
+
+
+def _config_data():
+    return {
+        "dhcp": {
+            "reservations": {"00:11:22:33:44:55": "192.168.1.100"},
+            "subnet": "192.168.1.0/24",
+            "gateway": "192.168.1.1"
+        },
+        "vlans": [{"id": 10, "name": "Data", "subnet": "192.168.10.0/24"}],
+        "dns_servers": ["8.8.8.8", "8.8.4.4"],
+        "firewall_rules": []
+    }
+
+
+def test_from_json_copies_are_isolated_from_cache():
+    config = NetworkConfig.from_json(_config_data())
+    config.vlans[0].id = 9999
+    config.dhcp.gateway = "bad"
+    config.dns_servers.append("not-an-ip")
+
+    fresh = NetworkConfig.from_json(_config_data())
+    assert fresh.vlans[0].id == 10
+    assert fresh.dhcp.gateway == "192.168.1.1"
+    assert fresh.dns_servers == ["8.8.8.8", "8.8.4.4"]
+    assert fresh.get_vlan(10) is fresh.vlans[0]
+    assert fresh.validate()
+
+
+def test_from_json_rejects_invalid_config():
+    data = _config_data()
+    data["vlans"].append({"id": 10, "name": "Dup", "subnet": "192.168.11.0/24"})
+    with pytest.raises(ValueError):
+        NetworkConfig.from_json(data)
+
+
+def test_reassigned_reservations_are_revalidated():
+    config = NetworkConfig.from_json(_config_data())
+    config.dhcp.reservations = {"zz": "notip"}
+    config.invalidate()
+    assert not config.validate()
+
+    with pytest.raises(TypeError):
+        config.dhcp.reservations["00:11:22:33:44:66"] = "192.168.1.101"
+
+
+def test_validate_detects_changes_since_last_success():
+    config = NetworkConfig.from_json(_config_data())
+    assert config.validate()
+
+    config.dhcp.reservations = {"00:11:22:33:44:55": "notip"}
+    assert not config.validate()
+
+    config.dhcp.reservations = {"00:11:22:33:44:55": "192.168.1.100"}
+    config.vlans[0].subnet = "bad"
+    assert not config.validate()
+
+
+def test_firewall_rules_behave_like_a_rule_list():
+    rules = [
+        {"action": "deny", "src_ip": "10.0.0.1", "port": 22},
+        {"action": "allow", "src_ip": "10.0.0.2"},
+        {"action": "deny", "dst_ip": "10.0.0.3"}
+    ]
+    data = _config_data()
+    data["firewall_rules"] = rules
+    firewall_rules = NetworkConfig.from_json(data).firewall_rules
+
+    assert firewall_rules == rules
+    assert firewall_rules[0] == rules[0]
+    assert firewall_rules[-1] == rules[-1]
+    assert firewall_rules[1:] == rules[1:]
+    assert list(firewall_rules) == rules
+    assert firewall_rules.where("action", "deny") == [rules[0], rules[2]]
+    assert firewall_rules.column("port") == (22, None, None)
+    with pytest.raises(IndexError):
+        firewall_rules[3]
+
+
+def test_from_json_accepts_non_finite_floats():
+    data = _config_data()
+    data["firewall_rules"] = [{"action": "allow", "weight": float("nan")}]
+    config = NetworkConfig.from_json(data)
+    assert config.firewall_rules.column("action") == ("allow",)
+
+
+def test_from_json_handles_unserializable_payload():
+    config = NetworkConfig.from_json({1: 2, "a": 3})
+    assert config.dhcp is None
+    assert config.vlans == []
+
+
+def test_dhcp_config_copies_and_pickles():
+    config = NetworkConfig.from_json(_config_data())
+    expected = {"00:11:22:33:44:55": "192.168.1.100"}
+
+    for dhcp in (copy.deepcopy(config).dhcp, copy.deepcopy(config.dhcp),
+                 pickle.loads(pickle.dumps(config.dhcp))):
+        assert dhcp.reservations == expected
+        assert dhcp.validate()
+        dhcp.reservations = {"zz": "192.168.1.100"}
+        assert not dhcp.validate()
+
+    assert dataclasses.asdict(config.dhcp)["reservations"] == expected
+    assert [f.name for f in dataclasses.fields(config.dhcp)] == ["reservations", "subnet", "gateway"]
+
+
+def test_firewall_rules_are_isolated_from_cache():
+    data = _config_data()
+    data["firewall_rules"] = [{"action": "allow", "ports": [22, 80], "meta": {"tag": "web"}}]
+    config = NetworkConfig.from_json(data)
+
+    with pytest.raises(TypeError):
+        config.firewall_rules[0]["ports"].append(23)
+    with pytest.raises(TypeError):
+        config.firewall_rules[0]["meta"]["tag"] = "db"
+    rule = config.firewall_rules[0]
+    rule["action"] = "deny"
+
+    fresh = NetworkConfig.from_json(data)
+    assert fresh.firewall_rules == data["firewall_rules"]
+    assert json.loads(json.dumps(fresh.firewall_rules.to_records())) == data["firewall_rules"]
+    assert copy.deepcopy(fresh.firewall_rules[0]["ports"]) == [22, 80]
+
+
+def test_validate_rejects_unhashable_addresses():
+    config = NetworkConfig()
+    config.dns_servers = [["8.8.8.8"]]
+    assert not config.validate()
+
+    assert not DHCPConfig({}, "192.168.1.0/24", ["192.168.1.1"]).validate()
+    assert not VLANConfig(10, "Data", {"subnet": "192.168.10.0/24"}).validate()
+
+
+def test_get_vlan_tracks_replaced_vlan_objects():
+    config = NetworkConfig.from_json(_config_data())
+    config.vlans = [VLANConfig(10, "Data", "192.168.10.0/24")]
+    assert config.validate()
+    assert config.get_vlan(10) is config.vlans[0]
+
+
+class _ConfigHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/config")
+            self.end_headers()
+        elif self.path == "/config":
+            body = b'{"dns_servers": ["8.8.8.8"]}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == "/slow":
+            time.sleep(3)
+            self.send_response(200)
+            self.end_headers()
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def config_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ConfigHandler)
+    server.daemon_threads = True
+    server.block_on_close = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_all_follows_redirects(config_server):
+    results = asyncio.run(ztp.fetch_all([f"{config_server}/redirect"]))
+    assert results == [{"dns_servers": ["8.8.8.8"]}]
+
+
+def test_fetch_all_cancels_pending_requests_on_failure(config_server):
+    async def run():
+        with pytest.raises(httpx.HTTPStatusError):
+            await ztp.fetch_all([f"{config_server}/slow", f"{config_server}/missing"])
+        return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ztp.requests.exceptions.HTTPError(f"{self.status_code} error")
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    calls = []
+    responses = []
+
+    def get(url, timeout, headers):
+        calls.append((url, headers))
+        return responses.pop(0)
+
+    monkeypatch.setattr(ztp._SESSION, "get", get)
+    return calls, responses
+
+
+def test_fetch_config_serves_fresh_hits_from_cache(fake_session):
+    calls, responses = fake_session
+    responses.append(_FakeResponse(200, b'{"dns_servers": ["8.8.8.8"]}'))
+
+    first = ztp.fetch_config("http://ztp/a")
+    first["dns_servers"].append("1.1.1.1")
+    assert ztp.fetch_config("http://ztp/a") == {"dns_servers": ["8.8.8.8"]}
+    assert len(calls) == 1
+
+
+def test_fetch_config_revalidates_stale_entry_with_304(fake_session, monkeypatch):
+    calls, responses = fake_session
+    responses.append(_FakeResponse(
+        200, b'{"dns_servers": ["8.8.8.8"]}',
+        {"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 00:00:00 GMT"}
+    ))
+    ztp.fetch_config("http://ztp/a")
+
+    monkeypatch.setattr(ztp, "_RESPONSE_CACHE_TTL", 0.0)
+    responses.append(_FakeResponse(304))
+    assert ztp.fetch_config("http://ztp/a") == {"dns_servers": ["8.8.8.8"]}
+    assert calls[1][1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 14 Oct 2026 00:00:00 GMT"
+    }
+
+    # The 304 refreshed the entry, so it is fresh again under the normal TTL
+    monkeypatch.setattr(ztp, "_RESPONSE_CACHE_TTL", 30.0)
+    ztp.fetch_config("http://ztp/a")
+    assert len(calls) == 2
+
+
+def test_fetch_config_replaces_stale_entry_on_200(fake_session, monkeypatch):
+    calls, responses = fake_session
+    responses.append(_FakeResponse(200, b'{"dns_servers": ["8.8.8.8"]}', {"ETag": '"v1"'}))
+    ztp.fetch_config("http://ztp/a")
+
+    monkeypatch.setattr(ztp, "_RESPONSE_CACHE_TTL", 0.0)
+    responses.append(_FakeResponse(200, b'{"dns_servers": ["9.9.9.9"]}', {"ETag": '"v2"'}))
+    assert ztp.fetch_config("http://ztp/a") == {"dns_servers": ["9.9.9.9"]}
+    assert ztp._RESPONSE_CACHE["http://ztp/a"][2] == {"ETag": '"v2"'}
+
+
+def test_fetch_config_evicts_oldest_entry(fake_session, monkeypatch):
+    calls, responses = fake_session
+    monkeypatch.setattr(ztp, "_RESPONSE_CACHE_MAXSIZE", 2)
+    for url in ("http://ztp/a", "http://ztp/b", "http://ztp/c"):
+        responses.append(_FakeResponse(200, b"{}"))
+        ztp.fetch_config(url)
+
+    assert set(ztp._RESPONSE_CACHE) == {"http://ztp/b", "http://ztp/c"}
+
+
+def test_invalidate_forces_full_request(fake_session):
+    calls, responses = fake_session
+    responses.append(_FakeResponse(200, b"{}", {"ETag": '"v1"'}))
+    ztp.fetch_config("http://ztp/a")
+
+    ztp.invalidate("http://ztp/a")
+    responses.append(_FakeResponse(200, b"{}"))
+    ztp.fetch_config("http://ztp/a")
+    assert calls[1] == ("http://ztp/a", {})
+
+
+def _ipv4address_accepts(address):
+    try:
+        ipaddress.IPv4Address(address)
+        return True
+    except ValueError:
+        return False
+
+
+@pytest.mark.parametrize("address", [
+    "0.0.0.0", "255.255.255.255", "192.168.1.1", "10.0.0.010",
+    "01.1.1.1", "00.1.1.1", "000.1.1.1", "255.255.255.256", "256.0.0.0",
+    "1000.1.1.1", "1..1.1", ".1.1.1", "1.1.1.", "1.1.1", "1.1.1.1.1", "",
+    "\u0661.1.1.1", "1.1.1.\u00b2", "+1.1.1.1", "-1.1.1.1", "0x1.1.1.1",
+    " 1.1.1.1", "1.1.1.1 ", "1.1.1.1\n", "1. 1.1.1", "::1", "a.b.c.d",
+])
+def test_fast_ipv4_matches_ipaddress(address):
+    assert ztp._fast_ipv4(address) == _ipv4address_accepts(address)
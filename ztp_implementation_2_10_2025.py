@@ -9,29 +9,234 @@ It handles DHCP, VLAN, DNS, and firewall settings with validation and error chec
 Key components:
 - DHCPConfig: Manages DHCP reservations and settings
 - VLANConfig: Handles VLAN configurations
+- FirewallRules: Columnar storage for firewall rules
 - NetworkConfig: Main class for overall network configuration
 - NetworkDevice: Abstract base class for different network devices
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import collections.abc
+import copy
 import ipaddress
 import json
 import logging
+import os
+import re
+import sys
+import threading
+import time
+import httpx
+import jsonschema
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
 
+# Prefer the C-accelerated orjson parser when the wheel is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Set up logging configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class DHCPConfig:
+# Shared HTTP session so repeated config pulls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+
+# Fetched configurations keyed by URL: (fetch time, JSON data, validator headers)
+_RESPONSE_CACHE: Dict[str, Tuple[float, dict, Dict[str, str]]] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_TTL = 30.0
+_RESPONSE_CACHE_MAXSIZE = 128
+
+# Colon-separated MAC address, e.g. 00:11:22:33:44:55
+_MAC_RE = re.compile(r'[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}')
+# Newline-joined list of MAC addresses, matched in a single pass
+_MAC_LIST_RE = re.compile(r'{0}(?:\n{0})*'.format(_MAC_RE.pattern))
+
+@lru_cache(maxsize=4096)
+def _ip_addr(address: str):
+    """Cached ipaddress.ip_address; raises ValueError for invalid input."""
+    return ipaddress.ip_address(address)
+
+@lru_cache(maxsize=4096)
+def _ip_net(network: str):
+    """Cached ipaddress.ip_network; raises ValueError for invalid input."""
+    return ipaddress.ip_network(network)
+
+def _parses(parse, value: str, context: str) -> bool:
+    """
+    Checks that value parses, logging the ValueError under context if not.
+    
+    Args:
+        parse: Parser such as _ip_addr or _ip_net
+        value (str): Value to parse
+        context (str): Label used in the error log message
+        
+    Returns:
+        bool: True if value parsed successfully
+    """
+    try:
+        parse(value)
+        return True
+    except (ValueError, TypeError) as e:
+        # TypeError covers unhashable input rejected by the parse cache
+        logger.error(f"{context} validation error: {e}")
+        return False
+
+def _fast_ipv4(address: str) -> bool:
+    """
+    Checks dotted-quad IPv4 syntax using string operations only.
+    
+    Accepts exactly what ipaddress.ip_address accepts for IPv4 strings:
+    four decimal octets in 0-255 without leading zeros.
+    
+    Args:
+        address (str): Address to check
+        
+    Returns:
+        bool: True if address is a valid IPv4 address
+    """
+    if not isinstance(address, str):
+        return False
+    parts = address.split('.')
+    return len(parts) == 4 and all(
+        p.isascii() and p.isdigit() and len(p) <= 3
+        and (p == '0' or p[0] != '0') and int(p) <= 255
+        for p in parts
+    )
+
+def _parses_ip(address: str, context: str) -> bool:
+    """
+    Checks an IP address, trying the IPv4 fast path before ipaddress.
+    
+    IPv6 addresses and anything the fast path rejects fall back to the cached
+    ipaddress parse, which also supplies the logged error message.
+    
+    Args:
+        address (str): Address to check
+        context (str): Label used in the error log message
+        
+    Returns:
+        bool: True if address is a valid IP address
+    """
+    return _fast_ipv4(address) or _parses(_ip_addr, address, context)
+
+_IP_ADDRESS_SCHEMA = {
+    "type": "string",
+    "anyOf": [{"format": "ipv4"}, {"format": "ipv6"}]
+}
+
+# Structural schema for configuration payloads accepted by NetworkConfig.from_json
+_NETWORK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "dhcp": {
+            "type": "object",
+            "required": ["reservations", "subnet", "gateway"],
+            "additionalProperties": False,
+            "properties": {
+                "reservations": {
+                    "type": "object",
+                    "propertyNames": {"pattern": f"^{_MAC_RE.pattern}$"},
+                    "additionalProperties": _IP_ADDRESS_SCHEMA
+                },
+                "subnet": {"type": "string"},
+                "gateway": _IP_ADDRESS_SCHEMA
+            }
+        },
+        "vlans": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["id", "name", "subnet"],
+                "additionalProperties": False,
+                "properties": {
+                    "id": {"type": "integer", "minimum": 1, "maximum": 4094},
+                    "name": {"type": "string"},
+                    "subnet": {"type": "string"}
+                }
+            }
+        },
+        "dns_servers": {"type": "array", "items": _IP_ADDRESS_SCHEMA},
+        "firewall_rules": {"type": "array", "items": {"type": "object"}}
+    }
+}
+
+# Compiled once at import; building a validator per call dominates its cost
+_VALIDATOR = jsonschema.Draft7Validator(
+    _NETWORK_SCHEMA,
+    format_checker=jsonschema.FormatChecker()
+)
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+class _ReadOnlyDict(dict):
+    """
+    dict that rejects in-place modification.
+    
+    Still a real dict for isinstance, json.dumps and dataclasses.asdict, and
+    copies or pickles as a plain dict.
+    """
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+class _ReadOnlyList(list):
+    """list counterpart of _ReadOnlyDict; copies or pickles as a plain list."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns a read-only equivalent of a JSON value.
+    
+    Nested dicts and lists become _ReadOnlyDict/_ReadOnlyList, which still
+    compare equal to the originals, and strings are interned.
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return _ReadOnlyDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze(v) for v in value)
+    return value
+
+class _DHCPColumns:
+    """Storage for DHCPConfig's derived columns, kept out of dataclass fields."""
+    __slots__ = ('_macs', '_ips')
+
+@dataclass(eq=False, repr=False, slots=True)
+class DHCPConfig(_DHCPColumns):
     """
     DHCP configuration container with validation.
     
     Attributes:
-        reservations (Dict[str, str]): MAC address to IP address mappings
+        reservations (Dict[str, str]): MAC address to IP address mappings,
+            read-only after construction; assign a new dict to replace it
         subnet (str): Network subnet in CIDR notation
         gateway (str): Gateway IP address
     """
@@ -39,6 +244,19 @@ class DHCPConfig:
     subnet: str
     gateway: str
 
+    def __setattr__(self, name, value):
+        # Rebuild the parallel MAC and IP columns whenever reservations is assigned
+        if name == 'reservations':
+            if type(value) is not _ReadOnlyDict:
+                value = _ReadOnlyDict(value)
+            object.__setattr__(self, '_macs', tuple(value))
+            object.__setattr__(self, '_ips', tuple(value.values()))
+        object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return (f"DHCPConfig(reservations={self.reservations!r}, "
+                f"subnet={self.subnet!r}, gateway={self.gateway!r})")
+
     def validate(self) -> bool:
         """
         Validates DHCP configuration components.
@@ -46,21 +264,20 @@ class DHCPConfig:
         Returns:
             bool: True if all components are valid, False otherwise
         """
-        try:
-            # Validate subnet and gateway addresses
-            ipaddress.ip_network(self.subnet)
-            ipaddress.ip_address(self.gateway)
-            
-            # Check each MAC address reservation
-            for mac, ip in self.reservations.items():
-                if not self._is_valid_mac(mac):
-                    logger.error(f"Invalid MAC address format: {mac}")
-                    return False
-                ipaddress.ip_address(ip)
-            return True
-        except ValueError as e:
-            logger.error(f"DHCP validation error: {e}")
+        # Validate subnet and gateway addresses
+        if not _parses(_ip_net, self.subnet, "DHCP"):
             return False
+        if not _parses_ip(self.gateway, "DHCP"):
+            return False
+        
+        # Check all MAC address reservations at once
+        if not self._all_valid_macs(self._macs):
+            bad_mac = next(m for m in self._macs if not self._is_valid_mac(m))
+            logger.error(f"Invalid MAC address format: {bad_mac}")
+            return False
+        
+        # Check each reserved IP address, stopping at the first failure
+        return all(_parses_ip(ip, "DHCP") for ip in self._ips)
 
     @staticmethod
     def _is_valid_mac(mac: str) -> bool:
@@ -73,15 +290,34 @@ class DHCPConfig:
         Returns:
             bool: True if MAC address format is valid
         """
-        if len(mac.split(':')) != 6:
+        # Reject wrong lengths before invoking the regex engine
+        if len(mac) != 17:
             return False
-        try:
-            int(mac.replace(':', ''), 16)
+        return _MAC_RE.fullmatch(mac) is not None
+
+    @staticmethod
+    def _all_valid_macs(macs: Sequence[str]) -> bool:
+        """
+        Validates a batch of MAC addresses in one regex pass.
+        
+        The addresses are joined with newlines and matched as a whole, so the
+        per-address work happens inside the regex engine rather than in Python.
+        The length check guarantees no address smuggles in its own separator.
+        
+        Args:
+            macs (Sequence[str]): MAC addresses to validate
+            
+        Returns:
+            bool: True if every MAC address format is valid
+        """
+        if not macs:
             return True
-        except ValueError:
+        joined = '\n'.join(macs)
+        if len(joined) != 18 * len(macs) - 1:
             return False
+        return _MAC_LIST_RE.fullmatch(joined) is not None
 
-@dataclass
+@dataclass(eq=False, repr=False, slots=True)
 class VLANConfig:
     """
     VLAN configuration container with validation.
@@ -95,6 +331,9 @@ class VLANConfig:
     name: str
     subnet: str
 
+    def __repr__(self) -> str:
+        return f"VLANConfig(id={self.id!r}, name={self.name!r}, subnet={self.subnet!r})"
+
     def validate(self) -> bool:
         """
         Validates VLAN configuration.
@@ -106,15 +345,154 @@ class VLANConfig:
         Returns:
             bool: True if configuration is valid
         """
-        try:
-            if not (1 <= self.id <= 4094):
-                logger.error(f"Invalid VLAN ID: {self.id}")
-                return False
-            ipaddress.ip_network(self.subnet)
-            return True
-        except ValueError as e:
-            logger.error(f"VLAN validation error: {e}")
+        if not (1 <= self.id <= 4094):
+            logger.error(f"Invalid VLAN ID: {self.id}")
             return False
+        return _parses(_ip_net, self.subnet, "VLAN")
+
+# Placeholder for fields a firewall rule does not define
+_MISSING = object()
+
+class FirewallRules(collections.abc.Sequence):
+    """
+    Columnar container for firewall rules.
+    
+    Rules are stored as one tuple per field rather than one dict per rule, and
+    repeated string values (actions, protocols) are interned so each distinct
+    value is stored once. The container is an immutable sequence of rule
+    dicts: indexing and iteration build each dict on demand, and it compares
+    equal to any list or tuple holding the same rules. Nested lists and dicts
+    inside rules are frozen on construction, so rules handed out can never
+    modify the stored values.
+    
+    Attributes:
+        columns (List[str]): Field names present in any rule
+    """
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, rules: Iterable[Dict] = ()):
+        rules = list(rules)
+        names = dict.fromkeys(name for rule in rules for name in rule)
+        self._columns: Dict[str, Tuple[Any, ...]] = {
+            name: tuple(_freeze(rule.get(name, _MISSING)) for rule in rules)
+            for name in names
+        }
+        self._length = len(rules)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        positions = range(self._length)[index]
+        if isinstance(index, slice):
+            return self._take(positions)
+        return self._record(positions)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._length):
+            yield self._record(i)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, collections.abc.Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(other) == self._length and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FirewallRules({self._length} rules, columns={self.columns})"
+
+    def _record(self, i: int) -> Dict:
+        """Builds the dict for rule i, containing only the fields it defines."""
+        return {
+            name: values[i]
+            for name, values in self._columns.items()
+            if values[i] is not _MISSING
+        }
+
+    def _take(self, indices: Sequence[int]) -> 'FirewallRules':
+        """Builds a new container holding the rules at the given positions."""
+        subset = FirewallRules()
+        subset._columns = {
+            name: tuple(values[i] for i in indices)
+            for name, values in self._columns.items()
+        }
+        subset._length = len(indices)
+        return subset
+
+    def column(self, name: str) -> Tuple[Any, ...]:
+        """
+        Returns every rule's value for a field.
+        
+        Args:
+            name (str): Field name
+            
+        Returns:
+            Tuple[Any, ...]: Values in rule order, None where a rule omits the field
+        """
+        values = self._columns.get(name, (_MISSING,) * self._length)
+        return tuple(None if v is _MISSING else v for v in values)
+
+    def where(self, name: str, value: Any) -> 'FirewallRules':
+        """
+        Selects rules whose field equals a value, e.g. where('action', 'deny').
+        
+        Args:
+            name (str): Field name to match
+            value (Any): Value to match
+            
+        Returns:
+            FirewallRules: Matching rules, in their original order
+        """
+        column = self._columns.get(name, ())
+        return self._take([i for i, v in enumerate(column) if v == value])
+
+    def to_records(self) -> List[Dict]:
+        """
+        Converts rules back to the list-of-dicts format, e.g. for json.dumps.
+        
+        Returns:
+            List[Dict]: One dict per rule, containing only the fields it defines
+        """
+        return list(self)
+
+def _parse_network_config(config_data: dict, config: 'NetworkConfig',
+                          DHCP=DHCPConfig, VLAN=VLANConfig,
+                          Rules=FirewallRules) -> 'NetworkConfig':
+    """
+    Populates a NetworkConfig from schema-validated JSON data.
+    
+    Specialized for _NETWORK_SCHEMA: keys are read directly and dataclasses are
+    built positionally instead of via keyword unpacking. The classes are bound
+    as default arguments so the hot loop avoids global lookups.
+    
+    Args:
+        config_data (dict): JSON data that has passed _VALIDATOR
+        config (NetworkConfig): Empty configuration to populate
+        
+    Returns:
+        NetworkConfig: The populated configuration
+    """
+    get = config_data.get
+    
+    # Parse DHCP configuration if present
+    dhcp = get('dhcp')
+    if dhcp is not None:
+        config.dhcp = DHCP(dhcp['reservations'], dhcp['subnet'], dhcp['gateway'])
+    
+    # Parse VLAN configurations
+    vlans = get('vlans')
+    if vlans is not None:
+        config.vlans = [VLAN(v['id'], v['name'], v['subnet']) for v in vlans]
+    
+    # Parse DNS and firewall configurations
+    config.dns_servers = get('dns_servers', [])
+    config.firewall_rules = Rules(get('firewall_rules', ()))
+    return config
 
 class NetworkConfig:
     """
@@ -126,11 +504,43 @@ class NetworkConfig:
     - DNS servers
     - Firewall rules
     """
+    __slots__ = ('dhcp', 'vlans', 'dns_servers', 'firewall_rules', '_vlans_by_id',
+                 '_validated_state')
+
     def __init__(self):
         self.dhcp: Optional[DHCPConfig] = None
         self.vlans: List[VLANConfig] = []
         self.dns_servers: List[str] = []
-        self.firewall_rules: List[Dict] = []
+        self.firewall_rules: FirewallRules = FirewallRules()
+        # VLANs keyed by ID, rebuilt on each successful validation
+        self._vlans_by_id: Dict[int, VLANConfig] = {}
+        # Snapshot of the validated fields from the last successful validation
+        self._validated_state: Optional[tuple] = None
+
+    def _state_key(self) -> Optional[tuple]:
+        """
+        Snapshots the fields checked by validate().
+        
+        Returns:
+            Optional[tuple]: Hashable snapshot, or None if a field is unhashable
+        """
+        dhcp = self.dhcp
+        state = (
+            None if dhcp is None else (
+                dhcp.subnet, dhcp.gateway, tuple(dhcp.reservations.items())
+            ),
+            tuple((v.id, v.name, v.subnet) for v in self.vlans),
+            tuple(self.dns_servers),
+        )
+        try:
+            hash(state)
+        except TypeError:
+            return None
+        return state
+
+    def invalidate(self) -> None:
+        """Forces the next validate() call to re-run every check."""
+        self._validated_state = None
 
     def validate(self) -> bool:
         """
@@ -142,33 +552,53 @@ class NetworkConfig:
         - No duplicate VLAN IDs
         - Valid DNS server IP addresses
         
+        Returns immediately if nothing has changed since the last successful
+        validation.
+        
         Returns:
             bool: True if all configurations are valid
         """
-        try:
-            # Validate DHCP configuration if present
-            if self.dhcp and not self.dhcp.validate():
+        state = self._state_key()
+        if state is not None and state == self._validated_state:
+            # Values are unchanged, but the VLAN objects may have been replaced
+            self._vlans_by_id = {vlan.id: vlan for vlan in self.vlans}
+            return True
+        
+        # Validate DHCP configuration if present
+        if self.dhcp and not self.dhcp.validate():
+            return False
+        
+        # Validate all VLAN configurations and check for duplicate IDs
+        vlans_by_id: Dict[int, VLANConfig] = {}
+        for vlan in self.vlans:
+            if not vlan.validate():
                 return False
-            
-            # Validate all VLAN configurations
-            for vlan in self.vlans:
-                if not vlan.validate():
-                    return False
-            
-            # Check for duplicate VLAN IDs
-            vlan_ids = [v.id for v in self.vlans]
-            if len(vlan_ids) != len(set(vlan_ids)):
-                logger.error("Duplicate VLAN IDs detected")
+            if vlan.id in vlans_by_id:
+                logger.error(f"Duplicate VLAN ID detected: {vlan.id}")
                 return False
-            
-            # Validate DNS server IP addresses
-            for dns in self.dns_servers:
-                ipaddress.ip_address(dns)
-                
-            return True
-        except ValueError as e:
-            logger.error(f"Network configuration validation error: {e}")
+            vlans_by_id[vlan.id] = vlan
+        
+        # Validate DNS server IP addresses, stopping at the first bad entry
+        if any(not _parses_ip(dns, "Network configuration") for dns in self.dns_servers):
             return False
+        
+        self._vlans_by_id = vlans_by_id
+        self._validated_state = state
+        return True
+
+    def get_vlan(self, vlan_id: int) -> Optional[VLANConfig]:
+        """
+        Looks up a VLAN configuration by ID.
+        
+        Reflects the VLAN list as of the last successful validate() call.
+        
+        Args:
+            vlan_id (int): VLAN ID to look up
+            
+        Returns:
+            Optional[VLANConfig]: Matching VLAN, or None if not configured
+        """
+        return self._vlans_by_id.get(vlan_id)
 
     @classmethod
     def from_json(cls, config_data: dict) -> 'NetworkConfig':
@@ -184,31 +614,97 @@ class NetworkConfig:
         Raises:
             ValueError: If configuration data is invalid
         """
-        config = cls()
+        # Identical payloads are parsed and validated once, then served from cache
+        try:
+            config_json = json.dumps(config_data, sort_keys=True)
+        except (TypeError, ValueError):
+            # Payloads with no canonical JSON form (e.g. mixed key types) bypass the cache
+            return cls._build(config_data)
+        return _copy_config(_from_json_cached(cls, config_json))
+
+    @classmethod
+    def _build(cls, config_data: dict) -> 'NetworkConfig':
+        """
+        Parses and validates JSON data without consulting the cache.
         
-        # Parse DHCP configuration if present
-        if 'dhcp' in config_data:
-            config.dhcp = DHCPConfig(**config_data['dhcp'])
+        Args:
+            config_data (dict): JSON configuration data
             
-        # Parse VLAN configurations
-        if 'vlans' in config_data:
-            config.vlans = [VLANConfig(**vlan) for vlan in config_data['vlans']]
+        Returns:
+            NetworkConfig: Initialized configuration object
             
-        # Parse DNS and firewall configurations
-        config.dns_servers = config_data.get('dns_servers', [])
-        config.firewall_rules = config_data.get('firewall_rules', [])
+        Raises:
+            ValueError: If configuration data is invalid
+        """
+        # Reject structurally invalid payloads before constructing dataclasses
+        error = jsonschema.exceptions.best_match(_VALIDATOR.iter_errors(config_data))
+        if error is not None:
+            location = '/'.join(str(p) for p in error.absolute_path) or '<root>'
+            logger.error(f"Configuration schema error at {location}: {error.message}")
+            raise ValueError("Invalid configuration data")
+        
+        config = _parse_network_config(config_data, cls())
         
         if not config.validate():
             raise ValueError("Invalid configuration data")
             
         return config
 
+@lru_cache(maxsize=32)
+def _from_json_cached(cls: type, config_json: str) -> NetworkConfig:
+    """Builds and caches a NetworkConfig keyed by its canonical JSON string."""
+    # The key was written by json.dumps, which may emit NaN/Infinity that
+    # orjson rejects, so it is read back with the matching stdlib parser
+    return cls._build(json.loads(config_json))
+
+@lru_cache(maxsize=32)
+def _load_config_file_cached(path: str, mtime_ns: int) -> NetworkConfig:
+    """Builds and caches a NetworkConfig keyed by file path and modification time."""
+    with open(path, "rb") as f:
+        return NetworkConfig._build(_json_loads(f.read()))
+
+def _copy_config(config: NetworkConfig) -> NetworkConfig:
+    """
+    Returns a copy of a cached configuration that callers may modify.
+    
+    Lists and the DHCP/VLAN dataclasses are copied so edits never reach the
+    cached instance. Firewall rules and DHCP reservations are read-only all
+    the way down, so they are shared.
+    """
+    clone = copy.copy(config)
+    clone.dhcp = copy.copy(config.dhcp)
+    clone.vlans = [copy.copy(vlan) for vlan in config.vlans]
+    clone.dns_servers = list(config.dns_servers)
+    clone._vlans_by_id = {vlan.id: vlan for vlan in clone.vlans}
+    return clone
+
+def load_config_file(path: str) -> NetworkConfig:
+    """
+    Load network configuration from a JSON file.
+    
+    Parsed configurations are cached until the file's modification time changes.
+    
+    Args:
+        path (str): Path to JSON configuration file
+        
+    Returns:
+        NetworkConfig: Initialized configuration object
+        
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If configuration data is invalid
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    return _copy_config(_load_config_file_cached(path, mtime_ns))
+
 class NetworkDevice(ABC):
     """
     Abstract base class for network devices.
     
     Provides common interface for all network devices (routers, switches, etc.)
     """
+    __slots__ = ('hostname', 'ip')
+
     def __init__(self, hostname: str, ip: str):
         self.hostname = hostname
         self.ip = ip
@@ -228,6 +724,8 @@ class NetworkDevice(ABC):
 
 class Router(NetworkDevice):
     """Router device implementation."""
+    __slots__ = ()
+
     def deploy_config(self, config: NetworkConfig) -> bool:
         """
         Deploy configuration to router.
@@ -246,6 +744,8 @@ class Router(NetworkDevice):
 
 class Switch(NetworkDevice):
     """Switch device implementation."""
+    __slots__ = ()
+
     def deploy_config(self, config: NetworkConfig) -> bool:
         """
         Deploy configuration to switch.
@@ -255,14 +755,74 @@ class Switch(NetworkDevice):
         """
         logger.info(f"Deploying configuration to switch {self.hostname}")
         
-        for vlan in config.vlans:
-            logger.info(f"Configuring VLAN {vlan.id} on {self.hostname}")
+        # One log record for all VLANs; the ID list is only built if INFO is enabled
+        if config.vlans and logger.isEnabledFor(logging.INFO):
+            logger.info("Configuring VLANs %s on %s", [v.id for v in config.vlans], self.hostname)
         return True
 
+_CacheEntry = Tuple[float, dict, Dict[str, str]]
+
+def _cache_lookup(api_url: str) -> Tuple[Optional[dict], Optional[_CacheEntry], Dict[str, str]]:
+    """
+    Looks up the cached response for a configuration URL.
+    
+    Args:
+        api_url (str): URL of configuration API
+        
+    Returns:
+        Tuple: Fresh data (or None if a request is needed), the cache entry
+        if any, and conditional headers for revalidating a stale entry
+    """
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(api_url)
+    
+    headers = {}
+    if entry:
+        fetched_at, data, validators = entry
+        if time.monotonic() - fetched_at < _RESPONSE_CACHE_TTL:
+            return copy.deepcopy(data), entry, headers
+        if 'ETag' in validators:
+            headers['If-None-Match'] = validators['ETag']
+        if 'Last-Modified' in validators:
+            headers['If-Modified-Since'] = validators['Last-Modified']
+    return None, entry, headers
+
+def _cache_store(api_url: str, data: dict, validators: Dict[str, str]) -> dict:
+    """
+    Stores a fetched response and returns a copy safe to hand to callers.
+    
+    Args:
+        api_url (str): URL of configuration API
+        data (dict): Parsed configuration data
+        validators (Dict[str, str]): ETag/Last-Modified response headers
+        
+    Returns:
+        dict: Copy of the configuration data
+    """
+    with _RESPONSE_CACHE_LOCK:
+        if api_url not in _RESPONSE_CACHE and len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAXSIZE:
+            # Evict the least recently fetched entry
+            oldest = min(_RESPONSE_CACHE, key=lambda url: _RESPONSE_CACHE[url][0])
+            del _RESPONSE_CACHE[oldest]
+        _RESPONSE_CACHE[api_url] = (time.monotonic(), data, validators)
+    return copy.deepcopy(data)
+
+def _response_validators(headers) -> Dict[str, str]:
+    """Extracts cache validator headers from an HTTP response."""
+    return {
+        name: headers[name]
+        for name in ('ETag', 'Last-Modified')
+        if name in headers
+    }
+
 def fetch_config(api_url: str) -> dict:
     """
     Fetch configuration from API server.
     
+    Responses are cached per URL for a short TTL. Once an entry expires it is
+    revalidated with If-None-Match/If-Modified-Since, and a 304 response
+    refreshes the cached copy without transferring the body again.
+    
     Args:
         api_url (str): URL of configuration API
         
@@ -271,19 +831,124 @@ def fetch_config(api_url: str) -> dict:
         
     Raises:
         requests.exceptions.RequestException: If API call fails
+        ValueError: If the response body is not valid JSON
+    """
+    data, entry, headers = _cache_lookup(api_url)
+    if data is not None:
+        return data
+    
+    try:
+        response = _SESSION.get(api_url, timeout=10, headers=headers)
+        if entry and response.status_code == 304:
+            data, validators = entry[1], entry[2]
+        else:
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            validators = _response_validators(response.headers)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.error(f"Failed to fetch configuration: {e}")
+        raise
+    return _cache_store(api_url, data, validators)
+
+def invalidate(api_url: str) -> None:
+    """
+    Drop the cached response for a configuration URL.
+    
+    The next fetch_config or fetch_config_async call for the URL performs
+    a full request.
+    
+    Args:
+        api_url (str): URL of configuration API
+    """
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.pop(api_url, None)
+
+def close_session() -> None:
+    """
+    Close the shared HTTP session and release pooled connections.
+    
+    Call once at shutdown after all configuration fetches are complete.
     """
+    _SESSION.close()
+
+async def fetch_config_async(client: httpx.AsyncClient, api_url: str) -> dict:
+    """
+    Fetch configuration from API server without blocking the event loop.
+    
+    Shares the response cache with fetch_config.
+    
+    Args:
+        client (httpx.AsyncClient): Client used for the request
+        api_url (str): URL of configuration API
+        
+    Returns:
+        dict: Configuration data
+        
+    Raises:
+        httpx.HTTPError: If API call fails
+        ValueError: If the response body is not valid JSON
+    """
+    data, entry, headers = _cache_lookup(api_url)
+    if data is not None:
+        return data
+    
     try:
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        # Follow redirects like requests does in fetch_config
+        response = await client.get(
+            api_url, timeout=10.0, headers=headers, follow_redirects=True
+        )
+        if entry and response.status_code == 304:
+            data, validators = entry[1], entry[2]
+        else:
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            validators = _response_validators(response.headers)
+    except (httpx.HTTPError, ValueError) as e:
         logger.error(f"Failed to fetch configuration: {e}")
         raise
+    return _cache_store(api_url, data, validators)
+
+async def fetch_all(urls: List[str]) -> List[dict]:
+    """
+    Fetch configurations for many devices concurrently.
+    
+    A single HTTP/2 client is shared across all requests, so requests to the
+    same host are multiplexed over one connection. If any request fails, the
+    others are cancelled before the client is closed.
+    
+    Args:
+        urls (List[str]): URLs of configuration API endpoints
+        
+    Returns:
+        List[dict]: Configuration data, in the same order as urls
+        
+    Raises:
+        httpx.HTTPError: If any API call fails
+        ValueError: If any response body is not valid JSON
+    """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=limits,
+        headers={"Accept": "application/json"},
+        follow_redirects=True
+    ) as client:
+        tasks = [asyncio.ensure_future(fetch_config_async(client, url)) for url in urls]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
 def deploy_configuration(config: NetworkConfig, devices: List[NetworkDevice]) -> bool:
     """
     Deploy configuration to all network devices.
     
+    Devices are configured concurrently on a bounded thread pool, since each
+    deployment is dominated by network I/O.
+    
     Args:
         config (NetworkConfig): Configuration to deploy
         devices (List[NetworkDevice]): List of target devices
@@ -291,26 +956,30 @@ def deploy_configuration(config: NetworkConfig, devices: List[NetworkDevice]) ->
     Returns:
         bool: True if deployment successful on all devices
     """
-    success = True
-    for device in devices:
+    if not devices:
+        return True
+    
+    def _deploy_one(device: NetworkDevice) -> Tuple[str, bool]:
         try:
             if not device.deploy_config(config):
-                success = False
                 logger.error(f"Failed to deploy config to {device.hostname}")
+                return device.hostname, False
+            return device.hostname, True
         except Exception as e:
-            success = False
             logger.error(f"Error deploying config to {device.hostname}: {e}")
-    return success
+            return device.hostname, False
+    
+    with ThreadPoolExecutor(max_workers=min(32, len(devices))) as pool:
+        results = list(pool.map(_deploy_one, devices))
+    return all(ok for _, ok in results)
 
 # Example usage
 if __name__ == "__main__":
-    # Simulate API response with local file
-    with open("config.json", "r") as f:
-        config_data = json.load(f)
-    
     try:
+        # Simulate API response with local file
+        network_config = load_config_file("config.json")
+        
         # Initialize and deploy configuration
-        network_config = NetworkConfig.from_json(config_data)
         devices = [
             Router("router1", "192.168.1.1"),
             Switch("switch1", "192.168.1.2")